@@ -43,6 +43,9 @@ from data.data_loader import LoadCountries, LoadCities
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
+# Number of record cards built at a time; the rest are built on demand via "Load more"
+RECORDS_PAGE_SIZE = 50
+
 # ============================================================================
 # HELPER FUNCTIONS 
 # ============================================================================
@@ -590,6 +593,11 @@ class RecordManagementSystem(ctk.CTk):
         
         self.current_section = "Client"
         
+        # Records matching the current view and how many of them have cards built
+        self._pending_records = []
+        self._rendered_count = 0
+        self._load_more_btn = None
+        
         self._create_layout()
         
         # FIX: Defer data loading and initial refresh to ensure CTK is fully initialized, 
@@ -794,7 +802,24 @@ class RecordManagementSystem(ctk.CTk):
                 enhanced_records.append(record)
             records = enhanced_records
         
-        for record in records:
+        # PERFORMANCE: Only the first page of cards is built; building a widget tree per
+        # record for thousands of records stalls the window.
+        self._pending_records = records
+        self._rendered_count = 0
+        self._load_more_btn = None
+        self._render_next_page()
+        
+        total = len(self.record_manager.GetAllRecords("Client"))
+        self.stats_count.configure(text=str(total))
+
+    def _render_next_page(self):
+        """Build the next page of record cards and a "Load more" button if records remain."""
+        if self._load_more_btn is not None:
+            self._load_more_btn.destroy()
+            self._load_more_btn = None
+        
+        end = self._rendered_count + RECORDS_PAGE_SIZE
+        for record in self._pending_records[self._rendered_count:end]:
             if self.current_section == "Client":
                 card = ClientCard(
                     self.records_container, record, on_edit=self._edit_record, on_delete=self._delete_record
@@ -814,9 +839,16 @@ class RecordManagementSystem(ctk.CTk):
                 continue # Should not happen
                 
             card.pack(fill="x", pady=(0, 10))
-        
-        total = len(self.record_manager.GetAllRecords("Client"))
-        self.stats_count.configure(text=str(total))
+        self._rendered_count = min(end, len(self._pending_records))
+        
+        remaining = len(self._pending_records) - self._rendered_count
+        if remaining > 0:
+            self._load_more_btn = ctk.CTkButton(
+                self.records_container, text=f"Load more ({remaining} remaining)", height=36, 
+                corner_radius=8, fg_color="#f0f0f0", hover_color="#e0e0e0", text_color="#1a1a1a", 
+                font=ctk.CTkFont(size=13), command=self._render_next_page
+            )
+            self._load_more_btn.pack(fill="x", pady=(0, 10))
 
     def _on_search(self, event):
         filter_text = self.search_entry.get()
@@ -1170,6 +1202,8 @@ class RecordManagementSystem(ctk.CTk):
 def main() -> None:
     app = RecordManagementSystem()
     app.mainloop()
+    # Saves run in the background; write the last ones and stop the writer before exiting
+    app.record_manager.Close()
 
 if __name__ == "__main__":
     main()
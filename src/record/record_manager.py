@@ -3,102 +3,600 @@ Record Manager Module
 Provides CRUD operations for Client, Airline, and Flight records
 """
 
-import jsonlines
+import logging
+import mmap
+import orjson
 import os
-from typing import List, Dict, Optional, Union
+import queue
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import BinaryIO, Iterator, List, Dict, Optional, Tuple, Union
 from datetime import datetime
 
+_log = logging.getLogger(__name__)
+
+
+# ============================================================================
+# DESERIALIZATION HELPERS
+# Looked up by record Type so Load does one dict probe per record. Saving needs
+# no counterpart: orjson writes datetime values natively.
+# ============================================================================
+
+def _identity(record: Dict) -> Dict:
+    """Return records that need no conversion unchanged."""
+    return record
+
+@lru_cache(maxsize=4096)
+def _parse_iso(date_str: str) -> datetime:
+    """Parse an ISO 8601 date. Flights often share a date, and datetime is immutable,
+    so repeats get the same cached object instead of being parsed again."""
+    return datetime.fromisoformat(date_str)
+
+def _as_int(value):
+    """Cast an ID read from file to int. Ints, the usual case, are returned without a call;
+    values that are not numbers are left unchanged."""
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+def _deserialize_flight(record: Dict) -> Dict:
+    """Parse the ISO Date string and ensure both foreign keys are integers."""
+    date_val = record.get("Date")
+    if isinstance(date_val, str):
+        try:
+            record["Date"] = _parse_iso(date_val)
+        except ValueError:
+            pass
+
+    # CRITICAL FIX: Ensure IDs are always integers for comparison later
+    if "Client_ID" in record:
+        record["Client_ID"] = _as_int(record["Client_ID"])
+    if "Airline_ID" in record:
+        record["Airline_ID"] = _as_int(record["Airline_ID"])
+    return record
+
+def _deserialize_entity(record: Dict) -> Dict:
+    """Ensure the ID of a Client or Airline record is an integer."""
+    if "ID" in record:
+        record["ID"] = _as_int(record["ID"])
+    return record
+
+_DESERIALIZERS = {
+    "Flight": _deserialize_flight,
+    "Client": _deserialize_entity,
+    "Airline": _deserialize_entity,
+}
+
+
+# ============================================================================
+# SEARCH HELPERS
+# The searchable fields are known per record Type, so the search data of a
+# record is built from those fields instead of every value of the record
+# ============================================================================
+
+_STR_FIELDS = {
+    "Client": ("Type", "Name", "Address_Line_1", "Address_Line_2", "Address_Line_3",
+               "City", "State", "Zip_Code", "Country", "Phone_Number"),
+    "Airline": ("Type", "Company_Name"),
+    # Date is a datetime once parsed; it only counts as text if it could not be parsed
+    "Flight": ("Type", "Date", "Start_City", "End_City"),
+}
+
+_INT_FIELDS = {
+    "Client": ("ID",),
+    "Airline": ("ID",),
+    "Flight": ("Client_ID", "Airline_ID"),
+}
+
+def _build_search_ints(record: Dict) -> Tuple[str, ...]:
+    """
+    Stringify the integer fields of a record once, so the exact-ID part of a search
+    is a membership test. Records of unknown Type offer every integer value.
+    """
+    fields = _INT_FIELDS.get(record.get("Type"))
+    if fields is None:
+        values = record.values()
+    else:
+        values = (record.get(field) for field in fields)
+    # type() rather than isinstance() so booleans are not treated as numbers
+    return tuple(str(value) for value in values if type(value) is int)
+
 
 class RecordManager:
-    """Main class for managing all record operations"""
+    """
+    Main class for managing all record operations.
+    Records are plain dicts, because the GUI, the tests and the JSONL file all use
+    them as mappings. Instead of per-record attributes, the manager keeps indexes
+    beside them (by ID, by flight key, by type), so lookups never read fields
+    record by record.
+    """
+
+    # Fields whose values repeat across many records (interned on load to share one string)
+    _SHARED_VALUE_FIELDS = ('Type', 'City', 'State', 'Country', 'Start_City', 'End_City')
+    # Number of distinct searches whose results are kept
+    _SEARCH_CACHE_SIZE = 128
+    # Queued by Close() to make the background writer thread exit
+    _STOP_WRITER = object()
     
-    def __init__(self, file_path: str = None):
+    def __init__(self, file_path: str = None, storage: Optional[BinaryIO] = None):
         """
         Initializes the Record Manager
         
         Args:
             file_path: Path to the JSONL file for storing records
+            storage: Optional seekable binary stream (e.g. io.BytesIO) holding the JSONL
+                data instead of a file, so tests can run without touching the disk.
+                It is read from the start and rewritten in place on save
         """
-        if file_path is None:
+        self._storage = storage
+        if file_path is None and storage is None:
             base_dir = os.path.dirname(os.path.abspath(__file__))
             file_path = os.path.join(base_dir, "record.jsonl")
         self.file_path = file_path
-        self.records: List[Dict] = []
+        # Created once here rather than on every save; '' means the current directory
+        self._dir = os.path.dirname(file_path) if file_path else ''
+        if self._dir:
+            os.makedirs(self._dir, exist_ok=True)
+        # Records keyed by id(record). A dict keeps insertion (file) order and deletes in O(1):
+        # CPython leaves a tombstone in the entry table and compacts it on the next resize,
+        # instead of shifting every later element like list.pop(i)
+        self._records: Dict[int, Dict] = {}
+        # Lowercased text of each record's string fields, under the same keys as _records
+        self._search_blob: Dict[int, str] = {}
+        # Integer fields of each record as strings, under the same keys as _records
+        self._search_ints: Dict[int, Tuple[str, ...]] = {}
+        # The same records split by Type, so filtering by type skips the other types entirely
+        self._by_type: Dict[str, Dict[int, Dict]] = {}
+        # Client and Airline records by (Type, ID) so lookups by ID skip the scan.
+        # IDs never change after creation, so in-place updates keep it valid. A file edited
+        # by hand may repeat an ID, so each key holds its records in file order
+        self._id_index: Dict[Tuple[str, int], List[Dict]] = {}
+        # Flight records by (Client_ID, Airline_ID). A pair can book several flights,
+        # so each key holds its flights in the order they were added
+        self._flight_index: Dict[Tuple[int, int], List[Dict]] = {}
+        # Highest ID per record type, so GenerateId does not rescan on every create.
+        # A type is dropped when its highest record is deleted and rebuilt on next use
+        self._max_id: Dict[str, int] = {}
+        # Bumped on every change so cached search results are never reused after a mutation
+        self._version = 0
+        # Search results keyed by (version, record type, lowercased term), least recently used first.
+        # A plain OrderedDict instead of functools.lru_cache, which on a bound method would keep
+        # the manager alive through the cache
+        self._search_cache: "OrderedDict[Tuple[int, Optional[str], str], Tuple[Dict, ...]]" = OrderedDict()
+        # The tuple returned by the records property, with the version it was built at
+        self._records_view: Tuple[int, Tuple[Dict, ...]] = (-1, ())
+        # Saves run on a background thread so callers on the Tk event loop never wait on disk I/O
+        self._save_queue: queue.Queue = queue.Queue()
+        self._save_thread: Optional[threading.Thread] = None
+        self._save_lock = threading.Lock()
+        # Held while records are added or removed together with their unwritten mark, and while
+        # the writer takes its snapshot, so the writer never sees one without the other
+        self._records_lock = threading.Lock()
+        # Set when the records differ from the file in a way only a full rewrite fixes.
+        # SaveRecords skips the write while it is clear; inside Batch() it notes that an
+        # update or delete needs a full save when the batch exits
+        self._batch_depth = 0
+        self._dirty = False
+        # Records created inside Batch(), appended together when it exits
+        self._batch_appends: List[Dict] = []
+        # Records created since the last full save that are not in the file yet, keyed like
+        # _records. The writer appends only these, so a record a rewrite already wrote is
+        # never appended a second time
+        self._unwritten: Dict[int, Dict] = {}
         self.LoadRecords()
+
+    @property
+    def records(self) -> Tuple[Dict, ...]:
+        """
+        All live records in file order, as a read-only tuple.
+        Add and remove records through the Create and Delete methods. The tuple is
+        rebuilt only after a change, so repeated reads do not copy the records.
+        """
+        version, view = self._records_view
+        if version != self._version:
+            view = tuple(self._records.values())
+            self._records_view = (self._version, view)
+        return view
     
     def LoadRecords(self) -> None:
-        """Load records from file system if exists"""  
-        if os.path.exists(self.file_path):  
-            try:  
-                with jsonlines.open(self.file_path, 'r') as reader:  
-                    self.records = [self.DeserializeRecord(r) for r in reader]  
-            except Exception as e:  
-                print(f"Error loading records: {e}")  
-                self.records = []  
-        else:  
-            self.records = []
+        """
+        Load records from file system if exists.
+        The file is memory-mapped and each line is handed to orjson as a slice of
+        the mapping, so lines are never copied into Python bytes objects and the
+        file contents stay in the shared OS page cache. Each record is added to
+        the records and the search blobs in the same pass.
+        """  
+        self._ClearRecords()
+        self._dirty = False
+        try:  
+            if self._storage is not None:
+                # Any readable binary stream works, not only io.BytesIO
+                self._storage.seek(0)
+                self._LoadLines(self._storage.read())
+            else:
+                # Opening directly saves a separate existence check; a missing file means no records yet
+                with open(self.file_path, 'rb') as f:
+                    # An empty file cannot be mapped
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            self._LoadLines(mm)
+        except FileNotFoundError:
+            pass
+        except Exception as e:  
+            _log.error("Error loading records: %s", e)
+            self._ClearRecords()
+            # Appending after the corrupt line would make every later load fail too,
+            # so the next write replaces the whole file
+            self._dirty = True
+        self._version += 1
+
+    def _LoadLines(self, data: Union[mmap.mmap, bytes]) -> None:
+        """Parse every line of JSONL data (a memory-mapped file or bytes) into the records"""
+        size = len(data)
+        start = 0
+        with memoryview(data) as view:
+            while start < size:
+                end = data.find(b'\n', start)
+                if end == -1:
+                    end = size
+                try:
+                    raw = orjson.loads(view[start:end])
+                except orjson.JSONDecodeError:
+                    # Blank lines are skipped; anything else is a corrupt file
+                    if data[start:end].strip():
+                        raise
+                else:
+                    self._AddRecord(self.DeserializeRecord(raw))
+                start = end + 1
+
+    def _ClearRecords(self) -> None:
+        """Drop all records together with the structures derived from them"""
+        self._records = {}
+        self._search_blob = {}
+        self._search_ints = {}
+        self._by_type = {}
+        self._id_index = {}
+        self._flight_index = {}
+        self._max_id = {}
+        self._unwritten = {}
+
+    def _AddRecord(self, record: Dict) -> None:
+        """Append a record and keep the structures derived from it in step"""
+        key = id(record)
+        record_type = record.get('Type')
+        self._records[key] = record
+        self._search_blob[key] = self._BuildSearchBlob(record)
+        self._search_ints[key] = _build_search_ints(record)
+        self._by_type.setdefault(record_type, {})[key] = record
+        if 'ID' in record:
+            # Lookups return the first record for an ID, as the old front-to-back scan did
+            record_id = record['ID']
+            self._id_index.setdefault((record_type, record_id), []).append(record)
+            if isinstance(record_id, int) and record_id > self._max_id.get(record_type, 0):
+                self._max_id[record_type] = record_id
+        elif record_type == 'Flight':
+            self._IndexFlight(record)
+
+    def _AddNewRecord(self, record: Dict) -> None:
+        """Add a record created by this manager and mark it as not written to the file yet"""
+        with self._records_lock:
+            self._AddRecord(record)
+            self._unwritten[id(record)] = record
+
+    def _RemoveRecord(self, record: Dict) -> None:
+        """Remove a record and everything derived from it in O(1)"""
+        with self._records_lock:
+            key = id(record)
+            record_type = record.get('Type')
+            del self._records[key]
+            del self._search_blob[key]
+            del self._search_ints[key]
+            del self._by_type[record_type][key]
+            # A deleted record that was never written must not be appended later
+            self._unwritten.pop(key, None)
+            if 'ID' in record:
+                record_id = record['ID']
+                # The next record with the same ID, if any, stays reachable
+                self._RemoveFromBucket(self._id_index, (record_type, record_id), record)
+                # Deleting the highest ID frees it again, as the full scan used to
+                if self._max_id.get(record_type) == record_id:
+                    del self._max_id[record_type]
+            elif record_type == 'Flight':
+                self._UnindexFlight(record)
+
+    def _IndexFlight(self, record: Dict) -> None:
+        """Add a flight under its current (Client_ID, Airline_ID) key"""
+        key = (record.get('Client_ID'), record.get('Airline_ID'))
+        self._flight_index.setdefault(key, []).append(record)
+
+    def _UnindexFlight(self, record: Dict) -> None:
+        """Remove a flight from the bucket of its current (Client_ID, Airline_ID) key"""
+        key = (record.get('Client_ID'), record.get('Airline_ID'))
+        self._RemoveFromBucket(self._flight_index, key, record)
+
+    @staticmethod
+    def _RemoveFromBucket(index: Dict[Tuple, List[Dict]], key: Tuple, record: Dict) -> None:
+        """Remove a record from its bucket in an index, dropping the key once it is empty"""
+        bucket = index[key]
+        # Compare by identity: two records with equal fields are still separate records
+        for i, other in enumerate(bucket):
+            if other is record:
+                del bucket[i]
+                break
+        if not bucket:
+            del index[key]
+
+    def _FindFlight(self, client_id: int, airline_id: int) -> Optional[Dict]:
+        """Return the first flight booked for a client with an airline, if any"""
+        bucket = self._flight_index.get((client_id, airline_id))
+        return bucket[0] if bucket else None
+
+    @staticmethod
+    def _BuildSearchBlob(record: Dict) -> str:
+        """
+        Join the lowercased string fields of a record so a search is a single substring test.
+        Fields are separated by a unit separator so a term cannot match across two fields.
+        Only the fields of the record's Type are used, so display keys the GUI adds to
+        records are never searched; records of unknown Type offer every string value.
+        """
+        fields = _STR_FIELDS.get(record.get("Type"))
+        if fields is None:
+            values = record.values()
+        else:
+            values = (record.get(field) for field in fields)
+        return "\x1f".join(v.lower() for v in values if isinstance(v, str))
+
+    def _RefreshSearchBlob(self, record: Dict) -> None:
+        """Rebuild the search data of a record after its fields were changed in place"""
+        key = id(record)
+        self._search_blob[key] = self._BuildSearchBlob(record)
+        self._search_ints[key] = _build_search_ints(record)
     
   
     def DeserializeRecord(self, record: Dict) -> Dict:  
         """  
         Convert serialized fields (like Date) into Python types (like datetime) 
         and ensure IDs are integers.
+        Repeated values are interned so records loaded from file share one copy
+        of each string instead of allocating it per line (orjson already shares
+        the key strings through its own key cache).
         """  
-        if record.get("Type") == "Flight":  
-            date_val = record.get("Date")  
-            if isinstance(date_val, str):  
-                try:  
-                    record["Date"] = datetime.fromisoformat(date_val)  
-                except ValueError:  
-                    pass
-            
-            # CRITICAL FIX: Ensure IDs are always integers for comparison later
-            if "Client_ID" in record:
-                try: record["Client_ID"] = int(record["Client_ID"])
-                except: pass
-            if "Airline_ID" in record:
-                try: record["Airline_ID"] = int(record["Airline_ID"])
-                except: pass
-
-        elif record.get("Type") in ["Client", "Airline"]:
-            if "ID" in record:
-                try: record["ID"] = int(record["ID"])
-                except: pass
-        
-        return record
+        for field in self._SHARED_VALUE_FIELDS:
+            value = record.get(field)
+            if isinstance(value, str):
+                record[field] = sys.intern(value)
+
+        return _DESERIALIZERS.get(record.get("Type"), _identity)(record)
 
     def SerializeRecord(self, record: Dict) -> Dict:  
         """  
         Convert Python types (like datetime) into JSON-serializable values.  
+        SaveRecords does not need this (orjson handles datetime); it is kept for
+        callers that hand records to the standard json module.
+        Only a record holding a datetime is copied; any other record is already
+        serializable and is returned as is, so callers must not modify the result.
         """  
-        record_copy = record.copy()  
-        if record_copy.get("Type") == "Flight":  
-            date_val = record_copy.get("Date")  
-            if isinstance(date_val, datetime):  
-                record_copy["Date"] = date_val.isoformat()  
-        return record_copy
+        date_val = record.get("Date")
+        if isinstance(date_val, datetime):
+            record_copy = record.copy()
+            record_copy["Date"] = date_val.isoformat()
+            return record_copy
+        return record
     
     def SaveRecords(self) -> bool:  
         """  
-        Save records to file system  
+        Save records to file system.
+        The file is written under a temporary name, synced to disk and then swapped
+        in with os.replace, so neither a crash nor a power loss mid-save leaves a
+        truncated record file.
           
         Returns:  
-            bool: True if successful, False otherwise  
+            bool: True if successful (or nothing changed since the last save), False otherwise  
         """  
-        # print(f"DEBUG MANAGER: Attempting to save {len(self.records)} records to {self.file_path}") # Added Debug Print
-        try:  
-            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)  
-            
-            serializable_records = [self.SerializeRecord(r) for r in self.records]  
-            with jsonlines.open(self.file_path, 'w') as writer:  
-                writer.write_all(serializable_records)  
+        tmp_path = None
+        with self._save_lock:
+            if not self._dirty:
+                return True
+            # Cleared before the snapshot, so a change made while writing marks it again
+            self._dirty = False
+            try:  
+                # Snapshot first: the GUI thread may add or delete records while we write.
+                # The snapshot holds every record created so far, so none is left to append
+                with self._records_lock:
+                    records = list(self._records.values())
+                    self._unwritten.clear()
+                # One JSON object per line, written through a large buffer. orjson writes
+                # datetime values natively in the same ISO 8601 form as isoformat(), so
+                # records are dumped as they are instead of being copied by SerializeRecord.
+                # OPT_APPEND_NEWLINE adds the line break inside orjson, so each record is one write
+                lines = (orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in records)
+                if self._storage is not None:
+                    self._storage.seek(0)
+                    self._storage.truncate()
+                    self._storage.writelines(lines)
+                else:
+                    tmp_path = self.file_path + '.tmp'
+                    with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                        f.writelines(lines)
+                        # The data must be on disk before the rename, or a power loss can leave an empty file
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.file_path)
+                    self._SyncDir()
                 
-            # print("DEBUG MANAGER: Records saved successfully to file.") # Added Debug Print
-            return True  
+                _log.debug("Saved %d records to %s", len(records), self.file_path)
+                return True  
             
-        except Exception as e:  
-            # print(f"DEBUG MANAGER: CRITICAL ERROR! Failed to save records: {e}") # Updated Error Print
-            return False
+            except Exception as e:  
+                _log.error("Failed to save records to %s: %s", self.file_path, e)
+                self._dirty = True
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                return False
+
+    def _SyncDir(self) -> None:
+        """
+        Sync the directory of the record file so the rename itself survives a power loss.
+        Only POSIX systems can open a directory; the file is already saved either way.
+        """
+        if os.name != 'posix':
+            return
+        try:
+            fd = os.open(self._dir or '.', os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            _log.warning("Could not sync directory of %s: %s", self.file_path, e)
+
+    def AppendRecords(self, records: List[Dict]) -> bool:
+        """
+        Append new records to the end of the file without rewriting it.
+        Only records that are still unwritten are appended: a full save that ran
+        since they were queued has already written them, and deleted records are skipped.
+
+        Args:
+            records: Records to append, in order
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        with self._save_lock:
+            with self._records_lock:
+                unwritten = self._unwritten
+                records = [r for r in records if unwritten.pop(id(r), None) is r]
+            if not records:
+                return True
+            try:
+                if self._storage is not None:
+                    self._AppendLines(self._storage, records)
+                else:
+                    with open(self.file_path, 'a+b') as f:
+                        self._AppendLines(f, records)
+                _log.debug("Appended %d records to %s", len(records), self.file_path)
+                return True
+            except Exception as e:
+                _log.error("Failed to append records to %s: %s", self.file_path, e)
+                return False
+
+    @staticmethod
+    def _AppendLines(f: BinaryIO, records: List[Dict]) -> None:
+        """Write records as JSON lines at the end of an open binary stream"""
+        f.seek(0, os.SEEK_END)
+        # A file edited by hand may not end with a newline; never glue two records together
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+        f.writelines(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in records)
+
+    def _RequestSave(self) -> None:
+        """Queue a full rewrite of the file for the background writer thread"""
+        self._QueueWrite(None)
+
+    def _RequestAppend(self, record: Dict) -> None:
+        """Queue a newly created record to be appended to the file by the writer thread"""
+        if self._batch_depth:
+            self._batch_appends.append(record)
+        else:
+            self._QueueWrite([record])
+
+    def _QueueWrite(self, item: Optional[List[Dict]]) -> None:
+        """
+        Hand a write to the background thread, starting it on first use.
+        Requests that pile up while a write is running are coalesced by the worker.
+        Inside a batch nothing is queued; the writes are issued when it exits.
+        """
+        if item is None:
+            self._dirty = True
+        if self._batch_depth:
+            return
+        if self._save_thread is None:
+            self._save_thread = threading.Thread(target=self._SaveWorker, name="RecordManagerSave", daemon=True)
+            self._save_thread.start()
+        self._save_queue.put(item)
+
+    def _SaveWorker(self) -> None:
+        """
+        Background loop that writes the records whenever saves have been requested.
+        Queue items are lists of new records to append, None for a full rewrite, or
+        _STOP_WRITER, which ends the loop once the writes drained with it are done.
+        A rewrite writes every record created before its snapshot and clears their unwritten
+        mark, so AppendRecords skips them even if their append is queued after it.
+        """
+        while True:
+            pending = [self._save_queue.get()]
+            while True:
+                try:
+                    pending.append(self._save_queue.get_nowait())
+                except queue.Empty:
+                    break
+            writes = [item for item in pending if item is not self._STOP_WRITER]
+            try:
+                # A pending full save (e.g. after a failed load) also covers the appends
+                if self._dirty or any(item is None for item in writes):
+                    self.SaveRecords()
+                elif writes and not self.AppendRecords([record for records in writes for record in records]):
+                    self._dirty = True
+                    self.SaveRecords()
+            finally:
+                for _ in pending:
+                    self._save_queue.task_done()
+            if len(writes) < len(pending):
+                return
+
+    def Flush(self) -> None:
+        """Block until every requested save has been written to the file"""
+        self._save_queue.join()
+
+    def Close(self) -> None:
+        """
+        Write every requested save, then stop the background writer thread.
+        The running thread keeps the manager and its records alive, so close a manager
+        that is no longer needed. A later change starts a new writer.
+        """
+        thread = self._save_thread
+        if thread is None:
+            return
+        self._save_queue.put(self._STOP_WRITER)
+        thread.join()
+        self._save_thread = None
+
+    @contextmanager
+    def Batch(self) -> Iterator["RecordManager"]:
+        """
+        Group many changes into a single write, e.g. for bulk inserts.
+        Batches can be nested; the write is requested when the outermost one exits.
+        A batch that only creates records appends them all at once; any update or
+        delete in it makes the write a full save instead. A full save queued before the
+        batch may run while it is open; records it writes are not appended again.
+
+        Usage:
+            with manager.Batch():
+                for ...:
+                    manager.CreateClient(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                appends, self._batch_appends = self._batch_appends, []
+                if self._dirty:
+                    self._RequestSave()
+                elif appends:
+                    self._QueueWrite(appends)
 
     
     def GenerateId(self, record_type: str) -> int:
@@ -111,15 +609,10 @@ class RecordManager:
         Returns:
             int: Unique ID
         """
-        if not self.records:
-            return 1
-        
-        # Get all IDs of the same type
-        same_type_records = [r for r in self.records if r.get('Type') == record_type]
-        if not same_type_records:
-            return 1
-        
-        max_id = max(r.get('ID', 0) for r in same_type_records)
+        max_id = self._max_id.get(record_type)
+        if max_id is None:
+            max_id = max((i for t, i in self._id_index if t == record_type and isinstance(i, int)), default=0)
+            self._max_id[record_type] = max_id
         return max_id + 1
     
     # CREATE operations
@@ -156,8 +649,9 @@ class RecordManager:
             'Country': country,
             'Phone_Number': phone_number
         }
-        self.records.append(record)
-        self.SaveRecords()
+        self._AddNewRecord(record)
+        self._version += 1
+        self._RequestAppend(record)
         return record
     
     def CreateAirline(self, company_name: str) -> Dict:
@@ -175,8 +669,9 @@ class RecordManager:
             'Type': 'Airline',
             'Company_Name': company_name
         }
-        self.records.append(record)
-        self.SaveRecords()
+        self._AddNewRecord(record)
+        self._version += 1
+        self._RequestAppend(record)
         return record
     
     def CreateFlight(self, client_id: int, airline_id: int, date: datetime,  
@@ -202,8 +697,9 @@ class RecordManager:
             'Start_City': start_city,  
             'End_City': end_city  
         }  
-        self.records.append(record)  
-        self.SaveRecords()  
+        self._AddNewRecord(record)
+        self._version += 1
+        self._RequestAppend(record)
         return record
     
     # READ operations
@@ -218,10 +714,8 @@ class RecordManager:
         Returns:
             Optional[Dict]: Record if found, None otherwise
         """
-        for record in self.records:
-            if record.get('ID') == record_id and record.get('Type') == record_type:
-                return record
-        return None
+        bucket = self._id_index.get((record_type, record_id))
+        return bucket[0] if bucket else None
     
     def GetAllRecords(self, record_type: Optional[str] = None) -> List[Dict]:
         """
@@ -234,8 +728,8 @@ class RecordManager:
             List[Dict]: List of records
         """
         if record_type:
-            return [r for r in self.records if r.get('Type') == record_type]
-        return self.records.copy()
+            return list(self._by_type.get(record_type, {}).values())
+        return list(self._records.values())
     
     def SearchRecords(self, search_term: str, record_type: Optional[str] = None) -> List[Dict]:
         """
@@ -248,22 +742,32 @@ class RecordManager:
         Returns:
             List[Dict]: List of matching records
         """
-        results = []
         search_lower = search_term.lower()
-        
-        for record in self.records:
-            if record_type and record.get('Type') != record_type:
-                continue
-            
-            # Search in all string fields
-            for value in record.values():
-                if isinstance(value, str) and search_lower in value.lower():
-                    results.append(record)
-                    break
-                elif isinstance(value, int) and search_term == str(value):
-                    results.append(record)
-                    break
-        return results
+        cache_key = (self._version, record_type, search_lower)
+        cache = self._search_cache
+        results = cache.get(cache_key)
+        if results is not None:
+            cache.move_to_end(cache_key)
+        else:
+            results = self._SearchUncached(search_lower, record_type)
+            cache[cache_key] = results
+            # Entries of older versions can never be hit again and age out from the front
+            if len(cache) > self._SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+        return list(results)
+
+    def _SearchUncached(self, search_lower: str, record_type: Optional[str]) -> Tuple[Dict, ...]:
+        """Scan the records for a lowercased search term. Results are cached by SearchRecords."""
+        results = []
+        search_blob = self._search_blob
+        search_ints = self._search_ints
+        records = self._by_type.get(record_type, {}) if record_type else self._records
+        for key, record in records.items():
+            # String fields are matched against the precomputed blob, integer fields exactly
+            # (so '07' or ' 7' never match ID 7)
+            if search_lower in search_blob[key] or search_lower in search_ints[key]:
+                results.append(record)
+        return tuple(results)
     
     # UPDATE operations
     def UpdateClient(self, record_id: int, **fields) -> Optional[Dict]:
@@ -282,10 +786,11 @@ class RecordManager:
             # Update allowed fields
             allowed_fields = ['Name', 'Address_Line_1', 'Address_Line_2', 'Address_Line_3',
                             'City', 'State', 'Zip_Code', 'Country', 'Phone_Number']
-            for key, value in fields.items():
-                if key in allowed_fields:
-                    record[key] = value
-            self.SaveRecords()
+            updates = {key: value for key, value in fields.items() if key in allowed_fields}
+            if self._ApplyUpdates(record, updates):
+                self._RefreshSearchBlob(record)
+                self._version += 1
+                self._RequestSave()
             return record
         return None
     
@@ -302,8 +807,10 @@ class RecordManager:
         """
         record = self.GetRecordById(record_id, 'Airline')
         if record:
-            record['Company_Name'] = company_name
-            self.SaveRecords()
+            if self._ApplyUpdates(record, {'Company_Name': company_name}):
+                self._RefreshSearchBlob(record)
+                self._version += 1
+                self._RequestSave()
             return record
         return None
     
@@ -319,36 +826,48 @@ class RecordManager:
         Returns:
             Optional[Dict]: Updated record if found, None otherwise
         """
-        # print(f"DEBUG MANAGER: START UpdateFlight. Target: (Old_C={old_client_id}, Old_A={old_airline_id})")
-        
-        # Find flight record by OLD Client_ID and OLD Airline_ID
-        for i, record in enumerate(self.records):
-            if record.get('Type') == 'Flight':
-                current_c_id = record.get('Client_ID')
-                current_a_id = record.get('Airline_ID')
-                
-                # Comparison should now work because IDs are guaranteed to be integers
-                if (current_c_id == old_client_id and 
-                    current_a_id == old_airline_id):
-                    
-                    # ***If this prints, the match is successful!***
-                    # print(f"DEBUG MANAGER: ***MATCH FOUND at Index {i}. Applying updates: {fields}") 
-                    
-                    # Apply Updates
-                    allowed_fields = ['Client_ID', 'Airline_ID', 'Date', 'Start_City', 'End_City']
-                    for key, value in fields.items():
-                        if key in allowed_fields:
-                            if key in ['Client_ID', 'Airline_ID']:
-                                record[key] = int(value) if value is not None else value
-                            else:
-                                record[key] = value
+        record = self._FindFlight(old_client_id, old_airline_id)
+        if record is None:
+            return None
 
-                    self.SaveRecords()
-                    # print(f"DEBUG MANAGER: ***Update COMPLETE. New Key: (C={record['Client_ID']}, A={record['Airline_ID']})")
-                    return record
+        allowed_fields = ['Client_ID', 'Airline_ID', 'Date', 'Start_City', 'End_City']
+        updates = {}
+        for key, value in fields.items():
+            if key in allowed_fields:
+                if key in ['Client_ID', 'Airline_ID']:
+                    updates[key] = int(value) if value is not None else value
+                else:
+                    updates[key] = value
+
+        # A flight whose IDs change moves to the index bucket of its new key
+        moved = any(key in updates and updates[key] != record.get(key) for key in ('Client_ID', 'Airline_ID'))
+        if moved:
+            self._UnindexFlight(record)
+        changed = self._ApplyUpdates(record, updates)
+        if moved:
+            self._IndexFlight(record)
+        if not changed:
+            return record
+
+        self._RefreshSearchBlob(record)
+        self._version += 1
+        self._RequestSave()
+        return record
+
+    @staticmethod
+    def _ApplyUpdates(record: Dict, updates: Dict) -> bool:
+        """
+        Write new field values into a record.
         
-        # print("DEBUG MANAGER: Record NOT FOUND after checking all flights.")
-        return None
+        Returns:
+            bool: True if any value actually changed, so callers can skip the save otherwise
+        """
+        changed = False
+        for key, value in updates.items():
+            if key not in record or record[key] != value:
+                record[key] = value
+                changed = True
+        return changed
 
     # DELETE operations
     def DeleteRecord(self, record_id: int, record_type: str) -> bool:
@@ -362,12 +881,13 @@ class RecordManager:
         Returns:
             bool: True if deleted, False if not found
         """
-        for i, record in enumerate(self.records):
-            if record.get('ID') == record_id and record.get('Type') == record_type:
-                self.records.pop(i)
-                self.SaveRecords()
-                return True
-        return False
+        record = self.GetRecordById(record_id, record_type)
+        if record is None:
+            return False
+        self._RemoveRecord(record)
+        self._version += 1
+        self._RequestSave()
+        return True
     
     def DeleteFlight(self, client_id: int, airline_id: int) -> bool:
         """
@@ -380,11 +900,10 @@ class RecordManager:
         Returns:
             bool: True if deleted, False if not found
         """
-        for i, record in enumerate(self.records):
-            if (record.get('Type') == 'Flight' and 
-                record.get('Client_ID') == client_id and 
-                record.get('Airline_ID') == airline_id):
-                self.records.pop(i)
-                self.SaveRecords()
-                return True
-        return False
+        record = self._FindFlight(client_id, airline_id)
+        if record is None:
+            return False
+        self._RemoveRecord(record)
+        self._version += 1
+        self._RequestSave()
+        return True
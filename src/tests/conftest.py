@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration for the unit tests.
+"""
+
+import os
+import sys
+
+# Put src/ on the path once for every test module, so they can import the
+# application packages (record, gui, data) directly
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Run the slow GUI tests (they build a Tk application) before everything else.
+    Under pytest-xdist the longest work is then handed out first, so it does not
+    end up as the last job on one worker while the others sit idle. The sort is
+    stable, so the order inside each group is unchanged.
+    """
+    items.sort(key=lambda item: 0 if "gui_skeleton" in item.nodeid else 1)
@@ -13,8 +13,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data.data_loader import LoadCountries, LoadCities
 from record.record_manager import RecordManager
+from functools import partial
 import random
-from time import process_time
+from time import perf_counter_ns
 import string
 
 
@@ -22,33 +23,46 @@ def performance_test(function_handle, function_name, *args):
     """
     A function that tests execution time.
     Function_name is used so that each function can be called.
+    Wall-clock time is measured so that file I/O waits are included.
     """
-    start_time = (process_time())
-    function_handle(*args)
-    end_time = (process_time())
-    print("Time elapsed for {name} : {time}".format(
-        name=function_name, time=(end_time-start_time)))
+    call = partial(function_handle, *args)
+    start_time = perf_counter_ns()
+    call()
+    end_time = perf_counter_ns()
+    print("Time elapsed for {name} : {time:.3f} ms".format(
+        name=function_name, time=(end_time-start_time) / 1e6))
 
 
-def load_capacity_test(amount_of_clients):
+def random_names(amount_of_names):
+    """
+    Generate random 5-letter names.
+    The letters for every name are drawn in one call and cut into names.
+    """
+    pool = "".join(random.choices(string.ascii_lowercase, k=5 * amount_of_names))
+    return [pool[i:i + 5] for i in range(0, len(pool), 5)]
+
+
+def load_capacity_test(manager, names):
     """
     Test load capacity of the record manager.
-    It creates random clients.
+    It creates a client for each of the given names.
     """
-    test_file = "tests_records/test_records.jsonl"
-    manager = RecordManager(test_file)
-    for i in range(amount_of_clients):
-        manager.CreateClient(
-            name="".join(random.choices(string.ascii_lowercase, k=5)),
-            address_line1="123 Main St",
-            address_line2="Apt 4B",
-            address_line3="",
-            city="New York",
-            state="NY",
-            zip_code="10001",
-            country="USA",
-            phone_number="555-1234"
-        )
+    # Save once at the end instead of after every client
+    with manager.Batch():
+        for name in names:
+            manager.CreateClient(
+                name=name,
+                address_line1="123 Main St",
+                address_line2="Apt 4B",
+                address_line3="",
+                city="New York",
+                state="NY",
+                zip_code="10001",
+                country="USA",
+                phone_number="555-1234"
+            )
+    # Include the background writes in the measured time
+    manager.Flush()
 
 def main():
     """
@@ -57,7 +71,12 @@ def main():
 
     performance_test(LoadCountries, "function LoadCountries")
     performance_test(LoadCities, "function LoadCities")
-    performance_test(load_capacity_test, "load capacity test",1000) #Generate 1000 random clients
+    # The manager and the random inputs are created before timing, so only the manager calls are measured
+    manager = RecordManager("tests_records/test_records.jsonl")
+    names = random_names(1000) #Generate 1000 random clients
+    performance_test(load_capacity_test, "load capacity test", manager, names)
+    performance_test(manager.SearchRecords, "function SearchRecords", random.choice(names))
+    manager.Close()
 
 
 
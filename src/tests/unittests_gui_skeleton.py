@@ -1,96 +1,95 @@
 import os
 import sys
-import unittest
-import customtkinter as ctk
 from datetime import datetime
 
-# Ensure src/ is on path so local imports work when running module directly
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from gui.gui_skeleton import RecordManagementSystem,datetime_to_string, _get_field
-
-
-class TestGUI(unittest.TestCase):
-    """
-    Test cases for the Graphical user interface.
-    """
-
-    def test_fetch_first_matching_key(self):
-        """Test the _get_field function to fetch the first matching key from a dictionary."""
-        record = {"ID": 1, "name": "Test Name", "Phone_Number": "5551234"}
-        # Test with the first matching key
-        self.assertEqual(_get_field(record, "ID", "id"), "1")
-        # Test with a fallback key
-        self.assertEqual(_get_field(record, "Name", "name"), "Test Name")
-        # Test with missing keys
-        self.assertEqual(_get_field(record, "Missing"), "")
-
-
-    def test_datetime_to_string (self):
-        """Test the datetime_to_string function to convert datetime to string."""
-        test_dt = datetime(2025, 12, 14, 14, 35, 10)
-        expected_str = "2025-12-14 14:35"
-        self.assertEqual(datetime_to_string(test_dt), expected_str)
-
-    def test_app_created(self):
-        """Test existence of application"""
-        app = RecordManagementSystem()
-
-        self.assertIsNotNone(app)
-        self.assertIsInstance(app,ctk.CTk)
-
-
-    def test_main_content_created(self):
-        """Test main content has been created"""
-        app = RecordManagementSystem()
-
-        self.assertIsInstance(app.main_frame, ctk.CTkFrame)
-        self.assertIsInstance(app.header_frame, ctk.CTkFrame)
-        self.assertIsInstance(app.section_title, ctk.CTkLabel)
-        self.assertIsInstance(app.search_frame, ctk.CTkFrame)
-        self.assertIsInstance(app.records_container, ctk.CTkScrollableFrame)
-        self.assertIsInstance(app.add_btn, ctk.CTkButton)
-        self.assertIsInstance(app.search_entry, ctk.CTkEntry)
-
-
-    def test_sidebar_created(self):
-        """Test sidebar has been created"""
-        app = RecordManagementSystem()
-
-        self.assertIsInstance(app.sidebar, ctk.CTkFrame)
-        self.assertIsInstance(app.logo_frame, ctk.CTkFrame)
-        self.assertIsInstance(app.logo_label, ctk.CTkLabel)
-        self.assertIsInstance(app.subtitle_label, ctk.CTkLabel)
-        self.assertIsInstance(app.stats_frame, ctk.CTkFrame)
-        self.assertIsInstance(app.stats_title, ctk.CTkLabel)
-        self.assertIsInstance(app.stats_count, ctk.CTkLabel)
-
-    def test_buttons_created(self):
-        """Test buttons have been created"""
-        app = RecordManagementSystem()
-
-        self.assertIn("Client", app.nav_buttons)
-        self.assertIn("Airline", app.nav_buttons)
-        self.assertIn("Flight", app.nav_buttons)
-
-        self.assertIsInstance(app.add_btn, ctk.CTkButton)
-
-        client_btn = app.nav_buttons["Client"]
-        self.assertEqual(app.current_section, "Client")
-        self.assertNotEqual(client_btn.cget("fg_color"), "transparent")
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)
-
-
-
-
-
-
+import pytest
 
+# The GUI dependencies are optional for the rest of the suite: without them this module is skipped
+ctk = pytest.importorskip("customtkinter")
+pytest.importorskip("tkcalendar")
 
+from gui.gui_skeleton import RecordManagementSystem,datetime_to_string, _get_field
 
+# Under pytest-xdist (--dist loadgroup) the GUI tests stay on one worker, sharing its Tk root
+pytestmark = pytest.mark.xdist_group("gui")
 
+# Tk needs a display; on headless Linux (e.g. CI without xvfb-run) the application tests are skipped
+HAS_DISPLAY = sys.platform in ("win32", "darwin") or bool(
+    os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+requires_display = pytest.mark.skipif(not HAS_DISPLAY, reason="no display available for Tk")
 
 
+@pytest.fixture(scope="module")
+def app():
+    """
+    The application under test.
+    The tests only inspect the widgets, so one application is built for the module.
+    """
+    app = RecordManagementSystem()
+    yield app
+    app.destroy()
+
+
+@pytest.mark.parametrize("keys, expected", [
+    (("ID", "id"), "1"),             # First matching key
+    (("Name", "name"), "Test Name"), # Fallback key
+    (("Missing",), ""),              # Missing keys
+])
+def test_fetch_first_matching_key(keys, expected):
+    """Test the _get_field function to fetch the first matching key from a dictionary."""
+    record = {"ID": 1, "name": "Test Name", "Phone_Number": "5551234"}
+    assert _get_field(record, *keys) == expected
+
+
+@pytest.mark.parametrize("test_dt, expected_str", [
+    (datetime(2025, 12, 14, 14, 35, 10), "2025-12-14 14:35"),
+    (datetime(2025, 1, 5, 9, 7), "2025-01-05 09:07"),
+])
+def test_datetime_to_string(test_dt, expected_str):
+    """Test the datetime_to_string function to convert datetime to string."""
+    assert datetime_to_string(test_dt) == expected_str
+
+
+@requires_display
+def test_app_created(app):
+    """Test existence of application"""
+    assert app is not None
+    assert isinstance(app, ctk.CTk)
+
+
+@pytest.mark.parametrize("attr, cls", [
+    # Main content
+    ("main_frame", ctk.CTkFrame),
+    ("header_frame", ctk.CTkFrame),
+    ("section_title", ctk.CTkLabel),
+    ("search_frame", ctk.CTkFrame),
+    ("records_container", ctk.CTkScrollableFrame),
+    ("add_btn", ctk.CTkButton),
+    ("search_entry", ctk.CTkEntry),
+    # Sidebar
+    ("sidebar", ctk.CTkFrame),
+    ("logo_frame", ctk.CTkFrame),
+    ("logo_label", ctk.CTkLabel),
+    ("subtitle_label", ctk.CTkLabel),
+    ("stats_frame", ctk.CTkFrame),
+    ("stats_title", ctk.CTkLabel),
+    ("stats_count", ctk.CTkLabel),
+])
+@requires_display
+def test_widget_created(app, attr, cls):
+    """Test main content and sidebar widgets have been created"""
+    assert isinstance(getattr(app, attr), cls)
+
+
+@requires_display
+def test_buttons_created(app):
+    """Test buttons have been created"""
+    assert "Client" in app.nav_buttons
+    assert "Airline" in app.nav_buttons
+    assert "Flight" in app.nav_buttons
+
+    assert isinstance(app.add_btn, ctk.CTkButton)
+
+    client_btn = app.nav_buttons["Client"]
+    assert app.current_section == "Client"
+    assert client_btn.cget("fg_color") != "transparent"
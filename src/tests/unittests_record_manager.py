@@ -2,174 +2,53 @@
 Unit tests for RecordManager class
 """
 
-import unittest
+import gc
+import io
 import os
-import sys
+import weakref
 from datetime import datetime
 
-# Ensure src/ is on path so local imports work when running module directly
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
 from record.record_manager import RecordManager
 
 
-class TestRecordManager(unittest.TestCase):
-    """Test cases for RecordManager"""
-
-    def setUp(self):
-        """Set up test fixtures"""
-        self.test_file = "tests/test_records.jsonl"
-        self.manager = RecordManager(self.test_file)
-
-    def tearDown(self):
-        """Clean up after tests"""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-
-    def test_create_client_record(self):
-        """Test creating a client record"""
-        record = self.manager.CreateClient(
-            name="John Doe",
-            address_line1="123 Main St",
-            address_line2="Apt 4B",
-            address_line3="",
-            city="New York",
-            state="NY",
-            zip_code="10001",
-            country="USA",
-            phone_number="555-1234"
-        )
-
-        self.assertIsNotNone(record)
-        self.assertEqual(record['Type'], 'Client')
-        self.assertEqual(record['Name'], 'John Doe')
-        self.assertEqual(record['City'], 'New York')
-        self.assertEqual(record['Phone_Number'], '555-1234')
-        self.assertIn('ID', record)
-        self.assertEqual(record['ID'], 1)
-
-
-    def test_create_airline_record(self):
-        """Test creating an airline record"""
-        record = self.manager.CreateAirline("Delta Airlines")
-
-        self.assertIsNotNone(record)
-        self.assertEqual(record['Type'], 'Airline')
-        self.assertEqual(record['Company_Name'], 'Delta Airlines')
-        self.assertIn('ID', record)
-        self.assertEqual(record['ID'], 1)
-
-    def test_create_flight_record(self):
-        """Test creating a flight record"""
-        flight_date = datetime(2024, 12, 25, 10, 0, 0)
-        record = self.manager.CreateFlight(
-            client_id=1,
-            airline_id=1,
-            date=flight_date,
-            start_city="New York",
-            end_city="Los Angeles"
-        )
-
-        self.assertIsNotNone(record)
-        self.assertEqual(record['Type'], 'Flight')
-        self.assertEqual(record['Client_ID'], 1)
-        self.assertEqual(record['Airline_ID'], 1)
-        self.assertIsInstance(record['Date'], datetime)
-        self.assertEqual(record['Start_City'], 'New York')
-        self.assertEqual(record['End_City'], 'Los Angeles')
-
-    # READ tests
-    def test_get_record_by_id(self):
-        """Test retrieving a record by ID"""
-        # Create a client record
-        created_client = self.manager.CreateClient(
-            name="Jane Smith",
-            address_line1="456 Oak Ave",
-            address_line2="",
-            address_line3="",
-            city="Los Angeles",
-            state="CA",
-            zip_code="90001",
-            country="USA",
-            phone_number="555-5678"
-        )
-
-        # Retrieve the client by ID
-        retrieved_client = self.manager.GetRecordById(created_client['ID'], 'Client')
-
-        self.assertIsNotNone(retrieved_client)
-        self.assertEqual(retrieved_client['ID'], created_client['ID'])
-        self.assertEqual(retrieved_client['Name'], 'Jane Smith')
-        self.assertEqual(retrieved_client['Type'], 'Client')
-
-        # Create an airline record
-        created_airline = self.manager.CreateAirline("United Airlines")
-
-        # Retrieve the airline by ID
-        retrieved_airline = self.manager.GetRecordById(created_airline['ID'], 'Airline')
-
-        self.assertIsNotNone(retrieved_airline)
-        self.assertEqual(retrieved_airline['ID'], created_airline['ID'])
-        self.assertEqual(retrieved_airline['Company_Name'], 'United Airlines')
-
-        # Test retrieving non-existent record
-        non_existent = self.manager.GetRecordById(999, 'Client')
-        self.assertIsNone(non_existent)
-
-    def test_get_all_records(self):
-        """Test retrieving all records"""
-        # Initially should be empty
-        all_records = self.manager.GetAllRecords()
-        self.assertEqual(len(all_records), 0)
-
-        # Create multiple records
-        self.manager.CreateClient(
-            name="Client 1",
-            address_line1="Address 1",
-            address_line2="",
-            address_line3="",
-            city="City 1",
-            state="ST",
-            zip_code="11111",
-            country="Country 1",
-            phone_number="555-0001"
-        )
-
-        self.manager.CreateClient(
-            name="Client 2",
-            address_line1="Address 2",
-            address_line2="",
-            address_line3="",
-            city="City 2",
-            state="ST",
-            zip_code="22222",
-            country="Country 2",
-            phone_number="555-0002"
-        )
-
-        self.manager.CreateAirline("Airline 1")
-        self.manager.CreateAirline("Airline 2")
-
-        self.manager.CreateFlight(1, 1, datetime(2024, 12, 25, 10, 0), "NYC", "LA")
-
-        # Get all records
-        all_records = self.manager.GetAllRecords()
-        self.assertEqual(len(all_records), 5)
-
-        # Get records filtered by type
-        clients = self.manager.GetAllRecords('Client')
-        self.assertEqual(len(clients), 2)
-
-        airlines = self.manager.GetAllRecords('Airline')
-        self.assertEqual(len(airlines), 2)
-
-        flights = self.manager.GetAllRecords('Flight')
-        self.assertEqual(len(flights), 1)
-
-    def test_search_records(self):
-        """Test searching records"""
-        # Create test data
-        self.manager.CreateClient(
+@pytest.fixture
+def records_file(tmp_path):
+    """
+    Path of the record file used by a test. Each test gets its own directory,
+    so tests can run in parallel and pytest removes the file afterwards.
+    """
+    return str(tmp_path / "test_records.jsonl")
+
+
+@pytest.fixture
+def manager():
+    """An empty RecordManager kept in memory, for tests that do not inspect the file"""
+    manager = RecordManager(storage=io.BytesIO())
+    yield manager
+    manager.Close()
+
+
+@pytest.fixture
+def file_manager(records_file):
+    """An empty RecordManager backed by records_file on disk"""
+    manager = RecordManager(records_file)
+    yield manager
+    # Stop the background writer so it cannot recreate the file after removal
+    manager.Close()
+
+
+@pytest.fixture(scope="session")
+def seeded_db(tmp_path_factory):
+    """
+    Record file holding the sample data shared by the read and search tests:
+    two clients, two airlines and one flight. Written once per test session.
+    """
+    path = str(tmp_path_factory.mktemp("seed") / "records.jsonl")
+    seed = RecordManager(path)
+    with seed.Batch():
+        seed.CreateClient(
             name="John Doe",
             address_line1="123 Main St",
             address_line2="",
@@ -180,8 +59,7 @@ class TestRecordManager(unittest.TestCase):
             country="USA",
             phone_number="555-1234"
         )
-
-        self.manager.CreateClient(
+        seed.CreateClient(
             name="Jane Smith",
             address_line1="456 Oak Ave",
             address_line2="",
@@ -192,193 +70,403 @@ class TestRecordManager(unittest.TestCase):
             country="USA",
             phone_number="555-5678"
         )
-
-        self.manager.CreateAirline("Delta Airlines")
-        self.manager.CreateAirline("United Airlines")
-
-        # Search by name
-        results = self.manager.SearchRecords("John")
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]['Name'], 'John Doe')
-
-        # Search by city
-        results = self.manager.SearchRecords("Los Angeles")
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]['City'], 'Los Angeles')
-
-        # Search case-insensitive
-        results = self.manager.SearchRecords("delta")
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]['Company_Name'], 'Delta Airlines')
-
-        # Search with type filter
-        results = self.manager.SearchRecords("Airlines", record_type='Airline')
-        self.assertEqual(len(results), 2)
-        for record in results:
-            self.assertEqual(record['Type'], 'Airline')
-
-        # Search by ID
-        results = self.manager.SearchRecords("1")
-        self.assertGreater(len(results), 0)
-
-        # Search with no results
-        results = self.manager.SearchRecords("NonExistent")
-        self.assertEqual(len(results), 0)
-
-    # UPDATE tests
-    def test_update_client_record(self):
-        """Test updating a client record"""
-        # Create a client
-        client = self.manager.CreateClient(
-            name="Old Name",
-            address_line1="Old Address",
-            address_line2="",
-            address_line3="",
-            city="Old City",
-            state="OS",
-            zip_code="11111",
-            country="Old Country",
-            phone_number="555-0000"
-        )
-
-        # Update single field
-        updated = self.manager.UpdateClient(client['ID'], Name="New Name")
-        self.assertIsNotNone(updated)
-        self.assertEqual(updated['Name'], 'New Name')
-        self.assertEqual(updated['City'], 'Old City')  # Other fields unchanged
-
-        # Update multiple fields
-        updated = self.manager.UpdateClient(
-            client['ID'],
-            City="New City",
-            Phone_Number="555-9999",
-            Address_Line_1="New Address"
-        )
-        self.assertEqual(updated['City'], 'New City')
-        self.assertEqual(updated['Phone_Number'], '555-9999')
-        self.assertEqual(updated['Address_Line_1'], 'New Address')
-        self.assertEqual(updated['Name'], 'New Name')  # Previously updated field
-
-        # Try to update non-existent record
-        result = self.manager.UpdateClient(999, Name="Test")
-        self.assertIsNone(result)
-
-    def test_update_airline_record(self):
-        """Test updating an airline record"""
-        # Create an airline
-        airline = self.manager.CreateAirline("Old Airline Name")
-
-        # Update the airline
-        updated = self.manager.UpdateAirline(airline['ID'], "New Airline Name")
-        self.assertIsNotNone(updated)
-        self.assertEqual(updated['Company_Name'], 'New Airline Name')
-        self.assertEqual(updated['ID'], airline['ID'])
-
-        # Try to update non-existent record
-        result = self.manager.UpdateAirline(999, "Test Airline")
-        self.assertIsNone(result)
-
-    def test_update_flight_record(self):
-        """Test updating a flight record"""
-        # Create a flight
-        old_date = datetime(2024, 12, 25, 10, 0, 0)
-        self.manager.CreateFlight(
-            client_id=1,
-            airline_id=1,
-            date=old_date,
-            start_city="New York",
-            end_city="Los Angeles"
-        )
-
-        # Update single field
-        new_date = datetime(2024, 12, 26, 14, 30, 0)
-        updated = self.manager.UpdateFlight(1, 1, Date=new_date)
-        self.assertIsNotNone(updated)
-        self.assertEqual(updated['Date'], new_date)
-        self.assertEqual(updated['Start_City'], 'New York')  # Unchanged
-
-        # Update multiple fields
-        updated = self.manager.UpdateFlight(
-            1, 1,
-            Start_City="Boston",
-            End_City="San Francisco"
-        )
-        self.assertEqual(updated['Start_City'], 'Boston')
-        self.assertEqual(updated['End_City'], 'San Francisco')
-        self.assertEqual(updated['Date'], new_date)  # Previously updated field
-
-        # Try to update non-existent flight
-        result = self.manager.UpdateFlight(999, 999, Start_City="Test")
-        self.assertIsNone(result)
-
-    # DELETE tests
-    def test_delete_record(self):
-        """Test deleting a record"""
-        # Create and delete a client
-        client = self.manager.CreateClient(
-            name="To Delete",
-            address_line1="Address",
-            address_line2="",
-            address_line3="",
-            city="City",
-            state="ST",
-            zip_code="12345",
-            country="Country",
-            phone_number="555-0000"
-        )
-
-        result = self.manager.DeleteRecord(client['ID'], 'Client')
-        self.assertTrue(result)
-
-        # Verify it's deleted
-        retrieved = self.manager.GetRecordById(client['ID'], 'Client')
-        self.assertIsNone(retrieved)
-
-        # Create and delete an airline
-        airline = self.manager.CreateAirline("To Delete Airlines")
-        result = self.manager.DeleteRecord(airline['ID'], 'Airline')
-        self.assertTrue(result)
-
-        # Verify it's deleted
-        retrieved = self.manager.GetRecordById(airline['ID'], 'Airline')
-        self.assertIsNone(retrieved)
-
-        # Try to delete non-existent record
-        result = self.manager.DeleteRecord(999, 'Client')
-        self.assertFalse(result)
-
-    def test_delete_flight_record(self):
-        """Test deleting a flight record"""
-        # Create a flight
-        self.manager.CreateFlight(
-            client_id=1,
-            airline_id=1,
-            date=datetime(2024, 12, 25, 10, 0, 0),
-            start_city="New York",
-            end_city="Los Angeles"
-        )
-
-        # Verify it exists
-        flights = self.manager.GetAllRecords('Flight')
-        self.assertEqual(len(flights), 1)
-
-        # Delete the flight
-        result = self.manager.DeleteFlight(1, 1)
-        self.assertTrue(result)
-
-        # Verify it's deleted
-        flights = self.manager.GetAllRecords('Flight')
-        self.assertEqual(len(flights), 0)
-
-        # Try to delete non-existent flight
-        result = self.manager.DeleteFlight(999, 999)
-        self.assertFalse(result)
-
-    # Edge cases
-    def test_generate_unique_ids(self):
-        """Test that IDs are unique"""
-        # Create multiple clients
-        client1 = self.manager.CreateClient(
+        seed.CreateAirline("Delta Airlines")
+        seed.CreateAirline("United Airlines")
+        seed.CreateFlight(1, 1, datetime(2024, 12, 25, 10, 0), "NYC", "LA")
+    seed.Close()
+    return path
+
+
+@pytest.fixture
+def seeded_manager(seeded_db):
+    """A RecordManager loaded from an in-memory copy of the seeded record file"""
+    with open(seeded_db, 'rb') as f:
+        manager = RecordManager(storage=io.BytesIO(f.read()))
+    yield manager
+    manager.Close()
+
+
+def test_create_client_record(manager):
+    """Test creating a client record"""
+    record = manager.CreateClient(
+        name="John Doe",
+        address_line1="123 Main St",
+        address_line2="Apt 4B",
+        address_line3="",
+        city="New York",
+        state="NY",
+        zip_code="10001",
+        country="USA",
+        phone_number="555-1234"
+    )
+
+    assert record is not None
+    fields = {key: record.get(key) for key in ('ID', 'Type', 'Name', 'City', 'Phone_Number')}
+    assert fields == {'ID': 1, 'Type': 'Client', 'Name': 'John Doe', 'City': 'New York',
+                      'Phone_Number': '555-1234'}
+
+
+def test_create_airline_record(manager):
+    """Test creating an airline record"""
+    record = manager.CreateAirline("Delta Airlines")
+
+    assert record == {'ID': 1, 'Type': 'Airline', 'Company_Name': 'Delta Airlines'}
+
+
+def test_create_flight_record(manager):
+    """Test creating a flight record"""
+    flight_date = datetime(2024, 12, 25, 10, 0, 0)
+    record = manager.CreateFlight(
+        client_id=1,
+        airline_id=1,
+        date=flight_date,
+        start_city="New York",
+        end_city="Los Angeles"
+    )
+
+    assert record is not None
+    assert record['Type'] == 'Flight'
+    assert record['Client_ID'] == 1
+    assert record['Airline_ID'] == 1
+    assert isinstance(record['Date'], datetime)
+    assert record['Start_City'] == 'New York'
+    assert record['End_City'] == 'Los Angeles'
+
+
+# READ tests
+def test_get_record_by_id(manager):
+    """Test retrieving a record by ID"""
+    # Create a client record
+    created_client = manager.CreateClient(
+        name="Jane Smith",
+        address_line1="456 Oak Ave",
+        address_line2="",
+        address_line3="",
+        city="Los Angeles",
+        state="CA",
+        zip_code="90001",
+        country="USA",
+        phone_number="555-5678"
+    )
+
+    # Retrieve the client by ID
+    retrieved_client = manager.GetRecordById(created_client['ID'], 'Client')
+
+    assert retrieved_client is not None
+    assert retrieved_client['ID'] == created_client['ID']
+    assert retrieved_client['Name'] == 'Jane Smith'
+    assert retrieved_client['Type'] == 'Client'
+
+    # Create an airline record
+    created_airline = manager.CreateAirline("United Airlines")
+
+    # Retrieve the airline by ID
+    retrieved_airline = manager.GetRecordById(created_airline['ID'], 'Airline')
+
+    assert retrieved_airline is not None
+    assert retrieved_airline['ID'] == created_airline['ID']
+    assert retrieved_airline['Company_Name'] == 'United Airlines'
+
+    # Test retrieving non-existent record
+    non_existent = manager.GetRecordById(999, 'Client')
+    assert non_existent is None
+
+
+def test_get_all_records(manager, seeded_manager):
+    """Test retrieving all records"""
+    # Initially should be empty
+    assert manager.GetAllRecords() == []
+
+    # All records, then filtered by type
+    counts = (
+        len(seeded_manager.GetAllRecords()),
+        len(seeded_manager.GetAllRecords('Client')),
+        len(seeded_manager.GetAllRecords('Airline')),
+        len(seeded_manager.GetAllRecords('Flight')),
+    )
+    assert counts == (5, 2, 2, 1)
+
+
+def test_search_records(seeded_manager):
+    """Test searching records"""
+    # Search by name
+    results = seeded_manager.SearchRecords("John")
+    assert (len(results), results[0]['Name']) == (1, 'John Doe')
+
+    # Search by city
+    results = seeded_manager.SearchRecords("Los Angeles")
+    assert (len(results), results[0]['City']) == (1, 'Los Angeles')
+
+    # Search case-insensitive
+    results = seeded_manager.SearchRecords("delta")
+    assert (len(results), results[0]['Company_Name']) == (1, 'Delta Airlines')
+
+    # Search with type filter
+    results = seeded_manager.SearchRecords("Airlines", record_type='Airline')
+    assert len(results) == 2
+    assert {record['Type'] for record in results} == {'Airline'}
+
+    # Search by ID
+    results = seeded_manager.SearchRecords("1")
+    assert len(results) > 0
+
+    # Search with no results
+    assert seeded_manager.SearchRecords("NonExistent") == []
+
+
+def test_search_records_by_id(manager):
+    """Test that numeric searches match integer fields exactly"""
+    manager.CreateAirline("Alpha Air")
+    manager.CreateAirline("Beta Air")
+
+    results = manager.SearchRecords("2", record_type='Airline')
+    assert len(results) == 1
+    assert results[0]['Company_Name'] == 'Beta Air'
+
+    # Leading zeros are not the same ID
+    results = manager.SearchRecords("02", record_type='Airline')
+    assert len(results) == 0
+
+
+def test_search_records_after_change(manager):
+    """Test that repeated searches see records changed since the last search"""
+    manager.CreateAirline("Delta Airlines")
+    results = manager.SearchRecords("delta")
+    assert len(results) == 1
+
+    # Same query after a create must not return the cached result
+    manager.CreateAirline("Delta Connection")
+    results = manager.SearchRecords("delta")
+    assert len(results) == 2
+
+    # Renamed record must no longer match its old name
+    manager.UpdateAirline(1, "Air France")
+    results = manager.SearchRecords("delta")
+    assert len(results) == 1
+    assert results[0]['Company_Name'] == 'Delta Connection'
+
+    # Mutating the returned list must not affect later results
+    results.clear()
+    assert len(manager.SearchRecords("delta")) == 1
+
+
+def test_search_does_not_span_fields(file_manager, records_file):
+    """Test that a term only matches within one field and search data stays out of records"""
+    client = file_manager.CreateClient(
+        name="Ann",
+        address_line1="Arbor Street",
+        address_line2="",
+        address_line3="",
+        city="Detroit",
+        state="MI",
+        zip_code="48104",
+        country="USA",
+        phone_number="555-0100"
+    )
+    assert len(file_manager.SearchRecords("ARBOR")) == 1
+    # Name and Address_Line_1 are adjacent in the search text
+    assert len(file_manager.SearchRecords("annarbor")) == 0
+
+    # The precomputed search text is kept beside the record, not in it
+    file_manager.Flush()
+    loaded = RecordManager(records_file).GetRecordById(client['ID'], 'Client')
+    assert set(loaded) == set(client)
+
+
+# UPDATE tests
+def test_update_client_record(manager):
+    """Test updating a client record"""
+    # Create a client
+    client = manager.CreateClient(
+        name="Old Name",
+        address_line1="Old Address",
+        address_line2="",
+        address_line3="",
+        city="Old City",
+        state="OS",
+        zip_code="11111",
+        country="Old Country",
+        phone_number="555-0000"
+    )
+
+    # Update single field
+    updated = manager.UpdateClient(client['ID'], Name="New Name")
+    assert updated is not None
+    assert updated['Name'] == 'New Name'
+    assert updated['City'] == 'Old City'  # Other fields unchanged
+
+    # Update multiple fields
+    updated = manager.UpdateClient(
+        client['ID'],
+        City="New City",
+        Phone_Number="555-9999",
+        Address_Line_1="New Address"
+    )
+    assert updated['City'] == 'New City'
+    assert updated['Phone_Number'] == '555-9999'
+    assert updated['Address_Line_1'] == 'New Address'
+    assert updated['Name'] == 'New Name'  # Previously updated field
+
+    # Try to update non-existent record
+    result = manager.UpdateClient(999, Name="Test")
+    assert result is None
+
+
+def test_update_airline_record(manager):
+    """Test updating an airline record"""
+    # Create an airline
+    airline = manager.CreateAirline("Old Airline Name")
+
+    # Update the airline
+    updated = manager.UpdateAirline(airline['ID'], "New Airline Name")
+    assert updated is not None
+    assert updated['Company_Name'] == 'New Airline Name'
+    assert updated['ID'] == airline['ID']
+
+    # Try to update non-existent record
+    result = manager.UpdateAirline(999, "Test Airline")
+    assert result is None
+
+
+def test_update_flight_record(manager):
+    """Test updating a flight record"""
+    # Create a flight
+    old_date = datetime(2024, 12, 25, 10, 0, 0)
+    manager.CreateFlight(
+        client_id=1,
+        airline_id=1,
+        date=old_date,
+        start_city="New York",
+        end_city="Los Angeles"
+    )
+
+    # Update single field
+    new_date = datetime(2024, 12, 26, 14, 30, 0)
+    updated = manager.UpdateFlight(1, 1, Date=new_date)
+    assert updated is not None
+    assert updated['Date'] == new_date
+    assert updated['Start_City'] == 'New York'  # Unchanged
+
+    # Update multiple fields
+    updated = manager.UpdateFlight(
+        1, 1,
+        Start_City="Boston",
+        End_City="San Francisco"
+    )
+    assert updated['Start_City'] == 'Boston'
+    assert updated['End_City'] == 'San Francisco'
+    assert updated['Date'] == new_date  # Previously updated field
+
+    # Try to update non-existent flight
+    result = manager.UpdateFlight(999, 999, Start_City="Test")
+    assert result is None
+
+
+def test_update_flight_ids(manager):
+    """Test that a flight can be found under its new IDs after they change"""
+    manager.CreateFlight(1, 1, datetime(2024, 12, 25, 10, 0, 0), "New York", "Los Angeles")
+
+    updated = manager.UpdateFlight(1, 1, Client_ID=2, Airline_ID="3")
+    assert updated['Client_ID'] == 2
+    assert updated['Airline_ID'] == 3
+
+    # Old key no longer matches, the new one does
+    assert manager.UpdateFlight(1, 1, Start_City="Boston") is None
+    assert not manager.DeleteFlight(1, 1)
+    assert manager.DeleteFlight(2, 3)
+    assert len(manager.GetAllRecords('Flight')) == 0
+
+
+# DELETE tests
+def test_delete_record(manager):
+    """Test deleting a record"""
+    # Create and delete a client
+    client = manager.CreateClient(
+        name="To Delete",
+        address_line1="Address",
+        address_line2="",
+        address_line3="",
+        city="City",
+        state="ST",
+        zip_code="12345",
+        country="Country",
+        phone_number="555-0000"
+    )
+
+    result = manager.DeleteRecord(client['ID'], 'Client')
+    assert result
+
+    # Verify it's deleted
+    retrieved = manager.GetRecordById(client['ID'], 'Client')
+    assert retrieved is None
+
+    # Create and delete an airline
+    airline = manager.CreateAirline("To Delete Airlines")
+    result = manager.DeleteRecord(airline['ID'], 'Airline')
+    assert result
+
+    # Verify it's deleted
+    retrieved = manager.GetRecordById(airline['ID'], 'Airline')
+    assert retrieved is None
+
+    # Try to delete non-existent record
+    result = manager.DeleteRecord(999, 'Client')
+    assert not result
+
+
+def test_delete_flight_record(manager):
+    """Test deleting a flight record"""
+    # Create a flight
+    manager.CreateFlight(
+        client_id=1,
+        airline_id=1,
+        date=datetime(2024, 12, 25, 10, 0, 0),
+        start_city="New York",
+        end_city="Los Angeles"
+    )
+
+    # Verify it exists
+    flights = manager.GetAllRecords('Flight')
+    assert len(flights) == 1
+
+    # Delete the flight
+    result = manager.DeleteFlight(1, 1)
+    assert result
+
+    # Verify it's deleted
+    flights = manager.GetAllRecords('Flight')
+    assert len(flights) == 0
+
+    # Try to delete non-existent flight
+    result = manager.DeleteFlight(999, 999)
+    assert not result
+
+
+def test_delete_keeps_record_order(file_manager, records_file):
+    """Test that deleting a record keeps the remaining records in creation order"""
+    for name in ("Airline A", "Airline B", "Airline C", "Airline D"):
+        file_manager.CreateAirline(name)
+
+    file_manager.DeleteRecord(2, 'Airline')
+    file_manager.DeleteRecord(4, 'Airline')
+    file_manager.CreateAirline("Airline E")
+
+    names = [r['Company_Name'] for r in file_manager.GetAllRecords('Airline')]
+    assert names == ["Airline A", "Airline C", "Airline E"]
+
+    # The rewritten file keeps the same order
+    file_manager.Flush()
+    reloaded = RecordManager(records_file)
+    assert [r['Company_Name'] for r in reloaded.records] == names
+
+# Edge cases
+
+
+def test_generate_unique_ids(manager):
+    """Test that IDs are unique"""
+    # Create multiple clients, written to storage in one go
+    with manager.Batch():
+        client1 = manager.CreateClient(
             name="Client 1",
             address_line1="Address 1",
             address_line2="",
@@ -390,7 +478,7 @@ class TestRecordManager(unittest.TestCase):
             phone_number="555-0001"
         )
 
-        client2 = self.manager.CreateClient(
+        client2 = manager.CreateClient(
             name="Client 2",
             address_line1="Address 2",
             address_line2="",
@@ -402,7 +490,7 @@ class TestRecordManager(unittest.TestCase):
             phone_number="555-0002"
         )
 
-        client3 = self.manager.CreateClient(
+        client3 = manager.CreateClient(
             name="Client 3",
             address_line1="Address 3",
             address_line2="",
@@ -414,93 +502,320 @@ class TestRecordManager(unittest.TestCase):
             phone_number="555-0003"
         )
 
-        # Check IDs are unique and sequential
-        self.assertEqual(client1['ID'], 1)
-        self.assertEqual(client2['ID'], 2)
-        self.assertEqual(client3['ID'], 3)
-
-        # Create multiple airlines
-        airline1 = self.manager.CreateAirline("Airline 1")
-        airline2 = self.manager.CreateAirline("Airline 2")
-
-        # Airlines should have their own ID sequence
-        self.assertEqual(airline1['ID'], 1)
-        self.assertEqual(airline2['ID'], 2)
-
-        # Delete a client and create a new one
-        self.manager.DeleteRecord(client2['ID'], 'Client')
-        client4 = self.manager.CreateClient(
-            name="Client 4",
-            address_line1="Address 4",
-            address_line2="",
-            address_line3="",
-            city="City 4",
-            state="S4",
-            zip_code="44444",
-            country="Country 4",
-            phone_number="555-0004"
-        )
-
-        # New ID should be 4 (not reusing deleted ID 2)
-        self.assertEqual(client4['ID'], 4)
-
-    def test_persistence(self):
-        """Test that records persist to file"""
-        # Create records
-        client = self.manager.CreateClient(
-            name="Persist Test",
-            address_line1="123 Persist St",
-            address_line2="",
-            address_line3="",
-            city="Persist City",
-            state="PS",
-            zip_code="99999",
-            country="Persist Country",
-            phone_number="555-9999"
-        )
-
-        airline = self.manager.CreateAirline("Persist Airlines")
-
-        flight_date = datetime(2024, 12, 25, 15, 45, 30)
-        flight = self.manager.CreateFlight(
-            client_id=client['ID'],
-            airline_id=airline['ID'],
-            date=flight_date,
-            start_city="Start City",
-            end_city="End City"
-        )
-
-        # Verify file exists
-        self.assertTrue(os.path.exists(self.test_file))
-
-        # Create a new manager instance (should load from file)
-        new_manager = RecordManager(self.test_file)
-
-        # Verify all records were loaded
-        self.assertEqual(len(new_manager.records), 3)
-
-        # Verify client was loaded correctly
-        loaded_client = new_manager.GetRecordById(client['ID'], 'Client')
-        self.assertIsNotNone(loaded_client)
-        self.assertEqual(loaded_client['Name'], 'Persist Test')
-        self.assertEqual(loaded_client['City'], 'Persist City')
-
-        # Verify airline was loaded correctly
-        loaded_airline = new_manager.GetRecordById(airline['ID'], 'Airline')
-        self.assertIsNotNone(loaded_airline)
-        self.assertEqual(loaded_airline['Company_Name'], 'Persist Airlines')
-
-        # Verify flight was loaded correctly with datetime
-        loaded_flights = new_manager.GetAllRecords('Flight')
-        self.assertEqual(len(loaded_flights), 1)
-        loaded_flight = loaded_flights[0]
-        self.assertEqual(loaded_flight['Client_ID'], client['ID'])
-        self.assertEqual(loaded_flight['Airline_ID'], airline['ID'])
-        self.assertIsInstance(loaded_flight['Date'], datetime)
-        self.assertEqual(loaded_flight['Date'], flight_date)
-        self.assertEqual(loaded_flight['Start_City'], 'Start City')
-        self.assertEqual(loaded_flight['End_City'], 'End City')
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2) # Give detailed feedback
\ No newline at end of file
+    # Check IDs are unique and sequential
+    assert client1['ID'] == 1
+    assert client2['ID'] == 2
+    assert client3['ID'] == 3
+
+    # Create multiple airlines
+    airline1 = manager.CreateAirline("Airline 1")
+    airline2 = manager.CreateAirline("Airline 2")
+
+    # Airlines should have their own ID sequence
+    assert airline1['ID'] == 1
+    assert airline2['ID'] == 2
+
+    # Delete a client and create a new one
+    manager.DeleteRecord(client2['ID'], 'Client')
+    client4 = manager.CreateClient(
+        name="Client 4",
+        address_line1="Address 4",
+        address_line2="",
+        address_line3="",
+        city="City 4",
+        state="S4",
+        zip_code="44444",
+        country="Country 4",
+        phone_number="555-0004"
+    )
+
+    # New ID should be 4 (not reusing deleted ID 2)
+    assert client4['ID'] == 4
+
+
+def test_persistence(file_manager, records_file):
+    """Test that records persist to file"""
+    # Create records
+    client = file_manager.CreateClient(
+        name="Persist Test",
+        address_line1="123 Persist St",
+        address_line2="",
+        address_line3="",
+        city="Persist City",
+        state="PS",
+        zip_code="99999",
+        country="Persist Country",
+        phone_number="555-9999"
+    )
+
+    airline = file_manager.CreateAirline("Persist Airlines")
+
+    flight_date = datetime(2024, 12, 25, 15, 45, 30)
+    flight = file_manager.CreateFlight(
+        client_id=client['ID'],
+        airline_id=airline['ID'],
+        date=flight_date,
+        start_city="Start City",
+        end_city="End City"
+    )
+
+    # Wait for pending saves, then verify file exists
+    file_manager.Flush()
+    assert os.path.exists(records_file)
+
+    # Create a new manager instance (should load from file)
+    new_manager = RecordManager(records_file)
+
+    # Verify all records were loaded
+    assert len(new_manager.records) == 3
+
+    # Verify client was loaded correctly
+    loaded_client = new_manager.GetRecordById(client['ID'], 'Client')
+    assert loaded_client is not None
+    assert loaded_client['Name'] == 'Persist Test'
+    assert loaded_client['City'] == 'Persist City'
+
+    # Verify airline was loaded correctly
+    loaded_airline = new_manager.GetRecordById(airline['ID'], 'Airline')
+    assert loaded_airline is not None
+    assert loaded_airline['Company_Name'] == 'Persist Airlines'
+
+    # Verify flight was loaded correctly with datetime
+    loaded_flights = new_manager.GetAllRecords('Flight')
+    assert len(loaded_flights) == 1
+    loaded_flight = loaded_flights[0]
+    assert loaded_flight['Client_ID'] == client['ID']
+    assert loaded_flight['Airline_ID'] == airline['ID']
+    assert isinstance(loaded_flight['Date'], datetime)
+    assert loaded_flight['Date'] == flight_date
+    assert loaded_flight['Start_City'] == 'Start City'
+    assert loaded_flight['End_City'] == 'End City'
+
+
+def test_in_memory_storage(records_file):
+    """Test that a manager given a stream saves into it instead of a file"""
+    storage = io.BytesIO()
+    manager = RecordManager(storage=storage)
+    manager.CreateAirline("Memory Air")
+    manager.CreateFlight(1, 1, datetime(2024, 12, 25, 10, 0), "NYC", "LA")
+    manager.UpdateAirline(1, "Memory Airways")
+    manager.Close()
+    assert manager.file_path is None
+
+    reloaded = RecordManager(storage=io.BytesIO(storage.getvalue()))
+    assert reloaded.GetRecordById(1, 'Airline')['Company_Name'] == 'Memory Airways'
+    assert reloaded.GetAllRecords('Flight')[0]['Date'] == datetime(2024, 12, 25, 10, 0)
+
+    # Any binary stream can be loaded, e.g. an open file positioned at its end
+    with open(records_file, 'w+b') as f:
+        f.write(storage.getvalue())
+        assert len(RecordManager(storage=f).records) == 2
+
+
+def test_records_view(manager):
+    """Test that the records property is a read-only tuple rebuilt only after a change"""
+    manager.CreateAirline("First")
+    records = manager.records
+    assert isinstance(records, tuple)
+    assert manager.records is records
+
+    manager.CreateAirline("Second")
+    assert [r['Company_Name'] for r in manager.records] == ["First", "Second"]
+    manager.DeleteRecord(1, 'Airline')
+    assert [r['Company_Name'] for r in manager.records] == ["Second"]
+
+
+def test_save_without_directory(tmp_path, monkeypatch):
+    """Test saving to a bare file name in the working directory"""
+    monkeypatch.chdir(tmp_path)
+    test_file = "test_records_no_dir.jsonl"
+    manager = RecordManager(test_file)
+    manager.CreateAirline("Local Air")
+    manager.UpdateAirline(1, "Local Airways")
+    manager.Flush()
+
+    loaded = RecordManager(test_file).GetRecordById(1, 'Airline')
+    assert loaded['Company_Name'] == 'Local Airways'
+    # The temporary file is renamed over the record file
+    assert not os.path.exists(test_file + '.tmp')
+
+
+def test_unchanged_update_skips_save(file_manager, records_file):
+    """Test that an update which changes nothing does not rewrite the file"""
+    file_manager.CreateAirline("Same Air")
+    file_manager.Flush()
+    os.remove(records_file)
+
+    updated = file_manager.UpdateAirline(1, "Same Air")
+    assert updated['Company_Name'] == "Same Air"
+    file_manager.Flush()
+    assert not os.path.exists(records_file)
+
+    # A real change is still written
+    file_manager.UpdateAirline(1, "Other Air")
+    file_manager.Flush()
+    assert os.path.exists(records_file)
+
+
+def test_batch_saves_once_on_exit(file_manager, records_file, monkeypatch):
+    """Test that records created inside a batch are appended in one write when it exits"""
+    appends, saves = [], []
+    append_records, save_records = file_manager.AppendRecords, file_manager.SaveRecords
+    monkeypatch.setattr(file_manager, "AppendRecords", lambda records: appends.append(len(records)) or append_records(records))
+    monkeypatch.setattr(file_manager, "SaveRecords", lambda: saves.append(True) or save_records())
+
+    with file_manager.Batch():
+        for i in range(5):
+            file_manager.CreateAirline(f"Airline {i}")
+        # Nothing is queued for saving while the batch is open
+        assert file_manager._save_queue.unfinished_tasks == 0
+
+    file_manager.Flush()
+    assert (appends, saves) == ([5], [])
+    new_manager = RecordManager(records_file)
+    assert len(new_manager.GetAllRecords('Airline')) == 5
+
+    # A delete inside a batch needs the whole file rewritten
+    with file_manager.Batch():
+        file_manager.CreateAirline("Airline 5")
+        file_manager.DeleteRecord(1, 'Airline')
+    file_manager.Flush()
+    assert (appends, saves) == ([5], [True])
+    names = [r['Company_Name'] for r in RecordManager(records_file).records]
+    assert names == ["Airline 1", "Airline 2", "Airline 3", "Airline 4", "Airline 5"]
+
+
+def test_save_between_create_and_append(file_manager, records_file, monkeypatch):
+    """Test that a record a full save already wrote is not appended again"""
+    file_manager.CreateAirline("First")
+    file_manager.Flush()
+
+    request_append = file_manager._RequestAppend
+    def save_then_append(record):
+        # The writer takes its snapshot after the record was added but before its append is queued
+        file_manager._dirty = True
+        file_manager.SaveRecords()
+        request_append(record)
+    monkeypatch.setattr(file_manager, "_RequestAppend", save_then_append)
+    file_manager.CreateAirline("Second")
+    file_manager.Flush()
+
+    with open(records_file, 'rb') as f:
+        assert len(f.read().splitlines()) == 2
+    reloaded = RecordManager(records_file)
+    assert reloaded.DeleteRecord(2, 'Airline')
+    assert [r['ID'] for r in reloaded.GetAllRecords('Airline')] == [1]
+
+
+def test_batch_during_queued_save(file_manager, records_file):
+    """Test that a batch opened while a full save is pending writes each record once"""
+    file_manager.CreateAirline("A0")
+    file_manager.Flush()
+    # The rewrite queued here may run while the batch below is still creating records
+    file_manager.UpdateAirline(1, "A1")
+    with file_manager.Batch():
+        for i in range(2000):
+            file_manager.CreateAirline(f"Airline {i}")
+    file_manager.Flush()
+
+    reloaded = RecordManager(records_file)
+    assert len(reloaded.records) == len(file_manager.records) == 2001
+    assert reloaded.GetRecordById(1, 'Airline')['Company_Name'] == "A1"
+
+
+def test_close_stops_writer(records_file):
+    """Test that Close writes pending saves and lets the manager be garbage collected"""
+    manager = RecordManager(records_file)
+    manager.CreateAirline("Closed Air")
+    thread = manager._save_thread
+    manager.Close()
+    assert not thread.is_alive()
+    assert RecordManager(records_file).GetRecordById(1, 'Airline')['Company_Name'] == "Closed Air"
+
+    # A change after closing starts a new writer
+    manager.UpdateAirline(1, "Reopened Air")
+    manager.Close()
+    assert RecordManager(records_file).GetRecordById(1, 'Airline')['Company_Name'] == "Reopened Air"
+
+    ref = weakref.ref(manager)
+    del manager
+    gc.collect()
+    assert ref() is None
+
+
+def test_create_appends_to_file(records_file):
+    """Test that new records are appended after a last line without a newline"""
+    with open(records_file, 'wb') as f:
+        f.write(b'{"ID": 1, "Type": "Airline", "Company_Name": "First"}')
+
+    manager = RecordManager(records_file)
+    manager.CreateAirline("Second")
+    manager.CreateAirline("Third")
+    manager.Flush()
+
+    with open(records_file, 'rb') as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 3
+    names = [r['Company_Name'] for r in RecordManager(records_file).records]
+    assert names == ["First", "Second", "Third"]
+
+
+def test_load_casts_ids_to_int(records_file):
+    """Test that IDs stored as strings are loaded as integers"""
+    with open(records_file, 'wb') as f:
+        f.write(b'{"ID": "3", "Type": "Airline", "Company_Name": "Text ID"}\n'
+                b'{"Type": "Flight", "Client_ID": "1", "Airline_ID": "x", "Date": "2024-12-25T10:00:00",'
+                b' "Start_City": "A", "End_City": "B"}\n')
+
+    loaded = RecordManager(records_file)
+    assert loaded.GetRecordById(3, 'Airline') is not None
+    flight = loaded.GetAllRecords('Flight')[0]
+    assert flight['Client_ID'] == 1
+    # Values that are not numbers are kept as they are
+    assert flight['Airline_ID'] == "x"
+    assert flight['Date'] == datetime(2024, 12, 25, 10, 0, 0)
+
+
+def test_create_after_corrupt_load(records_file):
+    """Test that records created after a failed load replace the corrupt file"""
+    with open(records_file, 'wb') as f:
+        f.write(b'{"ID": 1, "Type": "Airline", "Company_Name": "First"}\n'
+                b'{bad json\n')
+
+    manager = RecordManager(records_file)
+    assert manager.records == ()
+    manager.CreateAirline("New")
+    manager.Close()
+
+    names = [r['Company_Name'] for r in RecordManager(records_file).records]
+    assert names == ["New"]
+
+
+def test_duplicate_ids(records_file):
+    """Test that a record sharing its ID with a deleted one can still be found"""
+    with open(records_file, 'wb') as f:
+        f.write(b'{"ID": 1, "Type": "Airline", "Company_Name": "First"}\n'
+                b'{"ID": 1, "Type": "Airline", "Company_Name": "Copy"}\n')
+
+    manager = RecordManager(records_file)
+    assert manager.GetRecordById(1, 'Airline')['Company_Name'] == "First"
+    assert manager.DeleteRecord(1, 'Airline')
+    assert manager.GetRecordById(1, 'Airline')['Company_Name'] == "Copy"
+    # The remaining record still holds ID 1, so it is not handed out again
+    assert manager.CreateAirline("New")['ID'] == 2
+    assert manager.DeleteRecord(1, 'Airline')
+    assert manager.GetRecordById(1, 'Airline') is None
+    manager.Close()
+
+
+def test_load_skips_blank_lines(records_file):
+    """Test that blank lines and Windows line endings in the file are tolerated"""
+    with open(records_file, 'wb') as f:
+        f.write(b'{"ID": 1, "Type": "Airline", "Company_Name": "First"}\r\n'
+                b'\n'
+                b'   \n'
+                b'{"ID": 2, "Type": "Airline", "Company_Name": "Second"}')
+
+    loaded = RecordManager(records_file)
+    names = [r['Company_Name'] for r in loaded.records]
+    assert names == ["First", "Second"]
\ No newline at end of file